@@ -8,53 +8,65 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 # 导入点云IO模块
 from cloud_io import save_ply_file
 
-def generate_sphere_pointcloud(radius: float = 1.0, num_points: int = 5000) -> tuple:
+# 模块级随机数生成器（新Generator API比np.random全局单例更快且无全局锁）
+_rng = np.random.default_rng()
+
+
+def _reseed(seed):
+    """根据seed重建模块级随机数生成器（seed为None时保持当前生成器）"""
+    global _rng
+    if seed is not None:
+        _rng = np.random.default_rng(seed)
+
+
+def generate_sphere_pointcloud(radius: float = 1.0, num_points: int = 5000, seed: int = None) -> tuple:
     """
     生成球体点云
-    
+
     Args:
         radius: 球体半径
         num_points: 点的数量
-    
+        seed: 随机种子（可选，用于结果复现）
+
     Returns:
         tuple: (点坐标数组, 颜色数组)
     """
+    _reseed(seed)
     # 使用球坐标系生成均匀分布的点
-    theta = np.random.uniform(0, 2 * np.pi, num_points)
-    phi = np.random.uniform(0, np.pi, num_points)
-    
-    x = radius * np.sin(phi) * np.cos(theta)
-    y = radius * np.sin(phi) * np.sin(theta)
-    z = radius * np.cos(phi)
-    
-    points = np.vstack([x, y, z]).T
-    
+    theta = _rng.uniform(0, 2 * np.pi, num_points)
+    phi = _rng.uniform(0, np.pi, num_points)
+
+    # 按列直接写入预分配数组（避免vstack转置产生的非连续拷贝），sin(phi)只算一次
+    sin_phi = np.sin(phi)
+    points = np.empty((num_points, 3))
+    points[:, 0] = radius * sin_phi * np.cos(theta)
+    points[:, 1] = radius * sin_phi * np.sin(theta)
+    points[:, 2] = radius * np.cos(phi)
+
     # 根据位置生成颜色（热力图效果）
-    colors = np.zeros((num_points, 3))
+    colors = np.empty((num_points, 3))
     # 基于z坐标的颜色映射
-    colors[:, 0] = (z + radius) / (2 * radius)  # 红色
+    colors[:, 0] = (points[:, 2] + radius) / (2 * radius)  # 红色
     colors[:, 2] = 1 - colors[:, 0]  # 蓝色
-    colors[:, 1] = 0.5 * np.ones(num_points)  # 绿色适中
-    
+    colors[:, 1] = 0.5  # 绿色适中
+
     return points, colors
 
-def generate_cube_pointcloud(size: float = 2.0, num_points: int = 5000) -> tuple:
+def generate_cube_pointcloud(size: float = 2.0, num_points: int = 5000, seed: int = None) -> tuple:
     """
     生成立方体点云
-    
+
     Args:
         size: 立方体边长
         num_points: 点的数量
-    
+        seed: 随机种子（可选，用于结果复现）
+
     Returns:
         tuple: (点坐标数组, 颜色数组)
     """
+    _reseed(seed)
     half_size = size / 2
-    
-    # 生成立方体表面的随机点
-    points = []
-    colors = []
-    
+
     # 生成6个面
     faces = [
         # (normal direction, color)
@@ -65,121 +77,87 @@ def generate_cube_pointcloud(size: float = 2.0, num_points: int = 5000) -> tuple
         ((0, 0, 1), (1, 0, 1)),    # 品红右面
         ((0, 0, -1), (0, 1, 1)),   # 青色左面
     ]
-    
+
     points_per_face = num_points // len(faces)
-    
-    for (nx, ny, nz), (r, g, b) in faces:
-        # 生成面内的随机点
-        for _ in range(points_per_face):
-            # 根据法线方向确定固定坐标
-            fixed_coord = half_size if nx > 0 or ny > 0 or nz > 0 else -half_size
-            
-            if nx != 0:  # x固定
-                x = fixed_coord
-                y = np.random.uniform(-half_size, half_size)
-                z = np.random.uniform(-half_size, half_size)
-            elif ny != 0:  # y固定
-                x = np.random.uniform(-half_size, half_size)
-                y = fixed_coord
-                z = np.random.uniform(-half_size, half_size)
-            else:  # z固定
-                x = np.random.uniform(-half_size, half_size)
-                y = np.random.uniform(-half_size, half_size)
-                z = fixed_coord
-            
-            points.append([x, y, z])
-            colors.append([r, g, b])
-    
-    # 处理剩余的点
-    remaining_points = num_points - len(points)
+    face_colors = np.array([color for _, color in faces], dtype=np.float64)
+
+    def _sample_face(normal, count):
+        """在单个面内批量采样随机点（一次向量化调用代替逐点循环）"""
+        nx, ny, nz = normal
+        # 根据法线方向确定固定坐标轴和固定坐标值
+        fixed_axis = 0 if nx != 0 else (1 if ny != 0 else 2)
+        fixed_coord = half_size if nx > 0 or ny > 0 or nz > 0 else -half_size
+        free_axes = [axis for axis in range(3) if axis != fixed_axis]
+
+        pts = np.empty((count, 3))
+        pts[:, free_axes] = _rng.uniform(-half_size, half_size, size=(count, 2))
+        pts[:, fixed_axis] = fixed_coord
+        return pts
+
+    # 每个面批量生成随机点，颜色通过广播填充
+    points_list = [_sample_face(normal, points_per_face) for normal, _ in faces]
+    colors_list = [np.broadcast_to(face_colors[i], (points_per_face, 3))
+                   for i in range(len(faces))]
+
+    # 处理剩余的点：随机分配到各个面
+    remaining_points = num_points - points_per_face * len(faces)
     if remaining_points > 0:
-        for _ in range(remaining_points):
-            face_idx = np.random.randint(0, len(faces))
-            (nx, ny, nz), (r, g, b) = faces[face_idx]
-            
-            fixed_coord = half_size if nx > 0 or ny > 0 or nz > 0 else -half_size
-            
-            if nx != 0:
-                x = fixed_coord
-                y = np.random.uniform(-half_size, half_size)
-                z = np.random.uniform(-half_size, half_size)
-            elif ny != 0:
-                x = np.random.uniform(-half_size, half_size)
-                y = fixed_coord
-                z = np.random.uniform(-half_size, half_size)
-            else:
-                x = np.random.uniform(-half_size, half_size)
-                y = np.random.uniform(-half_size, half_size)
-                z = fixed_coord
-            
-            points.append([x, y, z])
-            colors.append([r, g, b])
-    
-    return np.array(points), np.array(colors)
+        face_indices = _rng.integers(0, len(faces), remaining_points)
+        for face_idx in range(len(faces)):
+            count = int(np.count_nonzero(face_indices == face_idx))
+            if count == 0:
+                continue
+            points_list.append(_sample_face(faces[face_idx][0], count))
+            colors_list.append(np.broadcast_to(face_colors[face_idx], (count, 3)))
 
-def generate_cylinder_pointcloud(radius: float = 1.0, height: float = 2.0, num_points: int = 5000) -> tuple:
+    return np.concatenate(points_list), np.concatenate(colors_list)
+
+def generate_cylinder_pointcloud(radius: float = 1.0, height: float = 2.0, num_points: int = 5000, seed: int = None) -> tuple:
     """
     生成圆柱体点云
-    
+
     Args:
         radius: 圆柱体半径
         height: 圆柱体高度
         num_points: 点的数量
-    
+        seed: 随机种子（可选，用于结果复现）
+
     Returns:
         tuple: (点坐标数组, 颜色数组)
     """
-    points = []
-    colors = []
-    
+    _reseed(seed)
     # 分配点数量：侧面60%，顶部20%，底部20%
     side_points = int(num_points * 0.6)
     top_points = int(num_points * 0.2)
     bottom_points = num_points - side_points - top_points
-    
-    # 生成圆柱体侧面的点
-    for _ in range(side_points):
-        # 随机角度和高度
-        theta = np.random.uniform(0, 2 * np.pi)
-        z = np.random.uniform(-height/2, height/2)
-        
-        # 极坐标转换为笛卡尔坐标
-        x = radius * np.cos(theta)
-        y = radius * np.sin(theta)
-        
-        points.append([x, y, z])
-        
-        # 基于高度的颜色映射（从底部蓝色到顶部红色）
-        t = (z + height/2) / height
-        colors.append([t, 0.5 * (1 - abs(2*t - 1)), 1 - t])
-    
-    # 生成圆柱体顶部的点
-    for _ in range(top_points):
-        # 顶部圆形区域内的随机点
-        r = radius * np.sqrt(np.random.uniform(0, 1))  # 使用平方根使点均匀分布
-        theta = np.random.uniform(0, 2 * np.pi)
-        
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        z = height / 2
-        
-        points.append([x, y, z])
-        colors.append([1, 0, 0])  # 顶部为红色
-    
-    # 生成圆柱体底部的点
-    for _ in range(bottom_points):
-        # 底部圆形区域内的随机点
-        r = radius * np.sqrt(np.random.uniform(0, 1))
-        theta = np.random.uniform(0, 2 * np.pi)
-        
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        z = -height / 2
-        
-        points.append([x, y, z])
-        colors.append([0, 0, 1])  # 底部为蓝色
-    
-    return np.array(points), np.array(colors)
+
+    # 生成圆柱体侧面的点（批量极坐标转换为笛卡尔坐标）
+    theta = _rng.uniform(0, 2 * np.pi, side_points)
+    z = _rng.uniform(-height / 2, height / 2, side_points)
+    pts_side = np.column_stack([radius * np.cos(theta), radius * np.sin(theta), z])
+
+    # 基于高度的颜色映射（从底部蓝色到顶部红色）
+    t = (z + height / 2) / height
+    colors_side = np.column_stack([t, 0.5 * (1 - np.abs(2 * t - 1)), 1 - t])
+
+    def _sample_disk(count, z_value):
+        """在圆盘区域内批量采样均匀分布的随机点（平方根使点均匀分布）"""
+        r = radius * np.sqrt(_rng.uniform(0, 1, count))
+        theta = _rng.uniform(0, 2 * np.pi, count)
+        return np.column_stack([r * np.cos(theta), r * np.sin(theta),
+                                np.full(count, z_value)])
+
+    # 生成圆柱体顶部和底部的点
+    pts_top = _sample_disk(top_points, height / 2)
+    pts_bottom = _sample_disk(bottom_points, -height / 2)
+
+    colors_top = np.broadcast_to(np.array([1.0, 0.0, 0.0]), (top_points, 3))  # 顶部为红色
+    colors_bottom = np.broadcast_to(np.array([0.0, 0.0, 1.0]), (bottom_points, 3))  # 底部为蓝色
+
+    points = np.vstack([pts_side, pts_top, pts_bottom])
+    colors = np.vstack([colors_side, colors_top, colors_bottom])
+
+    return points, colors
 
 def generate_sample_pointclouds(output_dir: str):
     """
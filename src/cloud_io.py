@@ -3,6 +3,16 @@ from typing import Tuple
 import os
 import plyfile
 
+# 已创建过的输出目录缓存，避免每次保存都调用os.makedirs
+_created_dirs = set()
+
+
+def _ensure_dir(dirpath: str):
+    """确保目录存在（带缓存，同一目录只创建一次）"""
+    if dirpath not in _created_dirs:
+        os.makedirs(dirpath, exist_ok=True)
+        _created_dirs.add(dirpath)
+
 
 def load_ply_file(filepath: str) -> Tuple[np.ndarray, np.ndarray]:
     """
@@ -23,39 +33,40 @@ def load_ply_file(filepath: str) -> Tuple[np.ndarray, np.ndarray]:
     
     try:
         with open(filepath, 'rb') as f:
-            plydata = plyfile.PlyData.read(f)
-        
+            # 内存映射读取，避免将整个文件先复制进内存
+            plydata = plyfile.PlyData.read(f, mmap='c')
+
         vertices = plydata['vertex']
-        
-        # 提取坐标数据
-        points = np.vstack([vertices['x'], vertices['y'], vertices['z']]).T
-        
+
+        # 提取坐标数据（column_stack直接得到C连续的Nx3数组）
+        # 整个管线统一使用float32：PLY中坐标本身就是f4，float64只会翻倍内存带宽
+        points = np.column_stack([vertices['x'], vertices['y'], vertices['z']]).astype(np.float32, copy=False)
+
         # 提取颜色数据（如果存在）
         colors = None
         if 'red' in vertices.data.dtype.names:
-            r = vertices['red'].astype(np.float32) / 255.0
-            g = vertices['green'].astype(np.float32) / 255.0
-            b = vertices['blue'].astype(np.float32) / 255.0
-            colors = np.vstack([r, g, b]).T
+            rgb = np.column_stack([vertices['red'], vertices['green'], vertices['blue']])
+            colors = rgb.astype(np.float32) * (1.0 / 255.0)
         else:
             # 如果没有颜色数据，使用默认颜色
-            colors = np.ones((len(points), 3)) * 0.5
-        
+            colors = np.full((len(points), 3), 0.5, dtype=np.float32)
+
         return points, colors
         
     except Exception as e:
         raise ValueError(f"读取PLY文件失败: {str(e)}")
 
 
-def save_ply_file(filepath: str, points: np.ndarray, colors: np.ndarray):
+def save_ply_file(filepath: str, points: np.ndarray, colors: np.ndarray, binary: bool = True):
     """
     保存点云数据到PLY文件
-    
+
     Args:
         filepath: 输出文件路径
         points: 坐标数组(Nx3)
         colors: 颜色数组(Nx3)，值范围[0,1]
-    
+        binary: 是否使用二进制格式（默认True，比ASCII格式更快且文件更小）
+
     Raises:
         ValueError: 数据格式错误
         IOError: 文件写入错误
@@ -70,32 +81,31 @@ def save_ply_file(filepath: str, points: np.ndarray, colors: np.ndarray):
     if colors.shape[1] != 3:
         raise ValueError("颜色数据必须是Nx3格式")
     
-    # 确保颜色值在有效范围内
-    colors = np.clip(colors, 0, 1)
-    
-    # 转换颜色为整数格式
-    colors_int = (colors * 255).astype(np.uint8)
-    
+    # 缩放并裁剪颜色值到[0,255]（乘法和clip原地进行，只保留一个临时缓冲）
+    scaled = np.multiply(colors, 255.0, dtype=np.float32)
+    np.clip(scaled, 0, 255, out=scaled)
+
     try:
-        # 创建顶点数据
+        # 创建顶点数据（坐标和颜色直接写入结构化数组的字段，
+        # 赋值时就地完成f4/u1类型转换，不再经过独立的uint8中间数组）
         vertex_data = np.empty(len(points), dtype=[
             ('x', 'f4'), ('y', 'f4'), ('z', 'f4'),
             ('red', 'u1'), ('green', 'u1'), ('blue', 'u1')
         ])
-        
+
         vertex_data['x'] = points[:, 0]
         vertex_data['y'] = points[:, 1]
         vertex_data['z'] = points[:, 2]
-        vertex_data['red'] = colors_int[:, 0]
-        vertex_data['green'] = colors_int[:, 1]
-        vertex_data['blue'] = colors_int[:, 2]
+        vertex_data['red'] = scaled[:, 0]
+        vertex_data['green'] = scaled[:, 1]
+        vertex_data['blue'] = scaled[:, 2]
         
-        # 创建PLY元素和文件
+        # 创建PLY元素和文件（二进制模式直接写出结构化数组，无需逐元素格式化）
         vertex_element = plyfile.PlyElement.describe(vertex_data, 'vertex')
-        plydata = plyfile.PlyData([vertex_element], text=True)
+        plydata = plyfile.PlyData([vertex_element], text=not binary, byte_order='<')
         
         # 确保输出目录存在
-        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+        _ensure_dir(os.path.dirname(os.path.abspath(filepath)))
         
         # 保存文件
         plydata.write(filepath)
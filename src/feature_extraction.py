@@ -2,6 +2,7 @@ import numpy as np
 import cv2
 import os
 from typing import Tuple
+from scipy.spatial import cKDTree
 
 
 def extract_sift_features(points: np.ndarray, colors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -43,11 +44,11 @@ def extract_sift_features(points: np.ndarray, colors: np.ndarray) -> Tuple[np.nd
     else:
         intensity = np.ones_like(z_values, dtype=np.uint8) * 128
     
-    # 创建图像
-    depth_img = np.zeros((img_size, img_size), dtype=np.uint8)
-    for i in range(len(points)):
-        x, y = img_coords[i]
-        depth_img[y, x] = intensity[i]
+    # 创建图像（向量化散射：同一像素落入多个点时保留最大强度）
+    flat_coords = img_coords[:, 1].astype(np.int64) * img_size + img_coords[:, 0]
+    depth_flat = np.zeros(img_size * img_size, dtype=np.uint8)
+    np.maximum.at(depth_flat, flat_coords, intensity)
+    depth_img = depth_flat.reshape(img_size, img_size)
     
     # 应用高斯模糊减少噪声
     depth_img = cv2.GaussianBlur(depth_img, (5, 5), 0)
@@ -59,42 +60,37 @@ def extract_sift_features(points: np.ndarray, colors: np.ndarray) -> Tuple[np.nd
     if len(keypoints) == 0:
         return np.array([]), np.array([])
     
-    # 将2D特征点映射回3D空间
-    feature_points = []
-    for kp in keypoints:
-        # 找到最近的3D点
-        img_x, img_y = int(kp.pt[0]), int(kp.pt[1])
-        distances = np.sum((img_coords - np.array([img_x, img_y])) ** 2, axis=1)
-        nearest_idx = np.argmin(distances)
-        feature_points.append(points[nearest_idx])
-    
-    return np.array(feature_points), descriptors
+    # 将2D特征点映射回3D空间（KD树批量查询最近的投影点）
+    # cv2.KeyPoint_convert一次C调用取出全部坐标，避免逐个访问kp.pt
+    kp_xy = cv2.KeyPoint_convert(keypoints).astype(np.int32)
+    tree = cKDTree(img_coords)
+    _, nearest_indices = tree.query(kp_xy, k=1)
+    feature_points = points[nearest_indices]
+
+    return feature_points, descriptors
 
 
 def save_features(filepath: str, keypoints: np.ndarray, descriptors: np.ndarray):
     """
-    保存特征点数据到NumPy文件
-    
+    保存特征点数据到NumPy文件(.npz)
+
     Args:
-        filepath: 输出文件路径
+        filepath: 输出文件路径（扩展名非.npz时会自动追加）
         keypoints: 特征点坐标数组(Nx3)
         descriptors: 描述子数组(Nx128)
-    
+
     Raises:
         IOError: 文件写入错误
     """
     # 确保输出目录存在
     os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
-    
+
     try:
-        # 将特征点和描述子保存为字典
-        features_data = {
-            'keypoints': keypoints,
-            'descriptors': descriptors
-        }
-        
-        np.save(filepath, features_data)
-        
+        # 按命名数组直接写出原始缓冲区，不经过pickle
+        np.savez(filepath,
+                 keypoints=np.ascontiguousarray(keypoints),
+                 descriptors=np.ascontiguousarray(descriptors))
+
     except Exception as e:
         raise IOError(f"保存特征点数据失败: {str(e)}")
 
@@ -117,15 +113,14 @@ def load_features(filepath: str) -> Tuple[np.ndarray, np.ndarray]:
         raise FileNotFoundError(f"文件不存在: {filepath}")
     
     try:
-        # 加载数据
-        features_data = np.load(filepath, allow_pickle=True).item()
-        
-        # 验证数据格式
-        if 'keypoints' not in features_data or 'descriptors' not in features_data:
-            raise ValueError("特征点数据格式错误")
-        
-        return features_data['keypoints'], features_data['descriptors']
-        
+        # 加载数据（npz中的命名数组，无需allow_pickle）
+        with np.load(filepath) as features_data:
+            # 验证数据格式
+            if 'keypoints' not in features_data or 'descriptors' not in features_data:
+                raise ValueError("特征点数据格式错误")
+
+            return features_data['keypoints'], features_data['descriptors']
+
     except Exception as e:
         if isinstance(e, FileNotFoundError):
             raise
@@ -148,11 +143,12 @@ def filter_features_by_quality(keypoints: np.ndarray, descriptors: np.ndarray, q
     if len(descriptors) == 0:
         return keypoints, descriptors
     
-    descriptor_norms = np.linalg.norm(descriptors, axis=1)
-    quality_scores = descriptor_norms / (np.max(descriptor_norms) + 1e-10)
-    
-    # 应用阈值过滤
-    mask = quality_scores > quality_threshold
+    # 质量只用于比例阈值，平方幅值即可（einsum单次逐行点积，免去逐点开方）
+    sq_norms = np.einsum('ij,ij->i', descriptors, descriptors)
+    quality_scores = sq_norms / (np.max(sq_norms) + 1e-10)
+
+    # 应用阈值过滤（分数在平方域，阈值也相应平方）
+    mask = quality_scores > quality_threshold ** 2
     
     return keypoints[mask], descriptors[mask]
 
@@ -172,13 +168,14 @@ def limit_feature_count(keypoints: np.ndarray, descriptors: np.ndarray, max_coun
     if len(keypoints) <= max_count:
         return keypoints, descriptors
     
-    # 计算描述子的幅值并按降序排序
-    descriptor_norms = np.linalg.norm(descriptors, axis=1)
-    sorted_indices = np.argsort(descriptor_norms)[::-1]
-    
-    # 选择前max_count个特征点
-    selected_indices = sorted_indices[:max_count]
-    
+    # 计算描述子的平方幅值（排序是单调的，无需开方），
+    # 再用argpartition做O(N)的top-K选择（免去全量排序）
+    sq_norms = np.einsum('ij,ij->i', descriptors, descriptors)
+    top_indices = np.argpartition(sq_norms, -max_count)[-max_count:]
+
+    # 只对选出的max_count个特征点按质量降序排序
+    selected_indices = top_indices[np.argsort(sq_norms[top_indices])[::-1]]
+
     return keypoints[selected_indices], descriptors[selected_indices]
 
 
@@ -4,6 +4,7 @@ import numpy as np
 import logging
 import sys
 import matplotlib
+from concurrent.futures import ThreadPoolExecutor
 
 # 设置matplotlib字体支持中文（尝试多种字体确保兼容性）
 matplotlib.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'WenQuanYi Micro Hei', 'Heiti TC', 'SimHei']  # 用来正常显示中文标签
@@ -16,7 +17,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from cloud_io import load_ply_file, save_ply_file
 from preprocessing import validate_pointcloud, normalize_coordinates, filter_outliers
 from feature_extraction import extract_sift_features, save_features, limit_feature_count
-from visualization import create_interactive_viewer, visualize_comparison
+from visualization import create_interactive_viewer, visualize_comparison, export_visualization_html
 
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -40,8 +41,8 @@ def parse_arguments():
                         help='是否保存特征点')
     parser.add_argument('--max_features', type=int, default=1000,
                         help='最大特征点数量')
-    # parser.add_argument('--export_html', type=bool, default=False,
-    #                     help='是否导出HTML可视化')  # 暂时禁用HTML导出功能
+    parser.add_argument('--export_html', type=bool, default=False,
+                        help='是否导出HTML可视化')
     return parser.parse_args()
 
 
@@ -120,17 +121,19 @@ def main():
     os.makedirs(args.output, exist_ok=True)
     
     try:
-        # 处理左摄像头点云
-        left_data = process_pointcloud(args.left)
-        
-        # 处理右摄像头点云
-        right_data = process_pointcloud(args.right)
+        # 左右摄像头点云相互独立，并行处理
+        # （NumPy/OpenCV的重计算阶段会释放GIL，双线程接近减半耗时）
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            left_future = executor.submit(process_pointcloud, args.left)
+            right_future = executor.submit(process_pointcloud, args.right)
+            left_data = left_future.result()
+            right_data = right_future.result()
         
         # 保存特征点
         if args.save_features:
             try:
-                left_feature_file = os.path.join(args.output, 'features_left.npy')
-                right_feature_file = os.path.join(args.output, 'features_right.npy')
+                left_feature_file = os.path.join(args.output, 'features_left.npz')
+                right_feature_file = os.path.join(args.output, 'features_right.npz')
                 
                 save_features(left_feature_file, left_data['keypoints'], left_data['descriptors'])
                 save_features(right_feature_file, right_data['keypoints'], right_data['descriptors'])
@@ -173,8 +176,20 @@ def main():
             except Exception as e:
                 logger.error(f"可视化失败: {str(e)}")
         
-        # 导出HTML功能已暂时禁用（依赖open3d）
-        
+        # 导出HTML可视化（浏览器端WebGL渲染，无需额外Python依赖）
+        if args.export_html:
+            try:
+                html_file = os.path.join(args.output, 'visualization.html')
+                export_visualization_html(
+                    left_data['filtered_points'],
+                    left_data['filtered_colors'],
+                    left_data['keypoints'],
+                    filepath=html_file
+                )
+                logger.info(f"HTML可视化已导出到 {html_file}")
+            except Exception as e:
+                logger.error(f"导出HTML失败: {str(e)}")
+
         logger.info("处理完成！")
         
     except KeyboardInterrupt:
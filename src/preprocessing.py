@@ -1,6 +1,9 @@
 import numpy as np
 from typing import Tuple
 
+# 降采样使用的随机数生成器（新Generator API，避免全局状态锁）
+_rng = np.random.default_rng()
+
 
 def validate_pointcloud(points: np.ndarray, colors: np.ndarray) -> bool:
     """
@@ -27,19 +30,20 @@ def validate_pointcloud(points: np.ndarray, colors: np.ndarray) -> bool:
     # 检查长度是否匹配
     if len(points) != len(colors):
         return False
-    
-    # 检查是否包含NaN或Inf
-    if np.isnan(points).any() or np.isinf(points).any():
+
+    # 检查点数是否合理（便宜的检查放在O(N)扫描之前，坏输入可以提前短路）
+    if len(points) == 0 or len(points) > 1000000:  # 限制在100万个点以内
         return False
-    
-    # 检查颜色值是否在合理范围内
-    if np.min(colors) < 0 or np.max(colors) > 1:
+
+    # 检查是否包含NaN或Inf（isfinite一次扫描同时覆盖两者）
+    if not np.isfinite(points).all():
         return False
-    
-    # 检查点数是否合理
-    if len(points) == 0 or len(points) > 1000000:  # 限制在100万个点以内
+
+    # 检查颜色值是否在合理范围内
+    cmin, cmax = colors.min(), colors.max()
+    if cmin < 0 or cmax > 1:
         return False
-    
+
     return True
 
 
@@ -54,21 +58,21 @@ def normalize_coordinates(points: np.ndarray) -> np.ndarray:
         np.ndarray: 归一化后的坐标数组
     """
     # 计算边界框
-    min_vals = np.min(points, axis=0)
-    max_vals = np.max(points, axis=0)
-    
+    min_vals = points.min(axis=0)
+    max_vals = points.max(axis=0)
+
     # 计算中心和范围
-    center = (min_vals + max_vals) / 2
-    range_vals = max_vals - min_vals
-    
+    center = 0.5 * (min_vals + max_vals)
+    max_range = float((max_vals - min_vals).max())
+
     # 避免除以零
-    max_range = np.max(range_vals)
     if max_range < 1e-10:
         return points - center  # 只有当范围非常小时，只进行中心化
-    
-    # 归一化到[-1, 1]范围
-    normalized_points = (points - center) / max_range
-    
+
+    # 归一化到[-1, 1]范围（减法结果上原地缩放，单次倒数乘法代替逐元素除法）
+    normalized_points = points - center
+    np.multiply(normalized_points, 1.0 / max_range, out=normalized_points)
+
     return normalized_points
 
 
@@ -79,21 +83,22 @@ def filter_outliers(points: np.ndarray, colors: np.ndarray, threshold: float = 2
     Args:
         points: 坐标数组(Nx3)
         colors: 颜色数组(Nx3)
-        threshold: 标准差阈值，默认为2.0
+        threshold: 标准差阈值（作用于平方距离），默认为2.0
     
     Returns:
         Tuple[np.ndarray, np.ndarray]: 过滤后的坐标和颜色数组
     """
-    # 计算每个点到均值的距离
+    # 计算每个点到均值的平方距离（einsum避免中间Nx3临时数组，并省去逐点开方）
     mean_point = np.mean(points, axis=0)
-    distances = np.linalg.norm(points - mean_point, axis=1)
-    
-    # 计算距离的均值和标准差
-    mean_distance = np.mean(distances)
-    std_distance = np.std(distances)
-    
+    diff = points - mean_point
+    sq_distances = np.einsum('ij,ij->i', diff, diff)
+
+    # 在平方距离上计算均值和标准差并套用阈值
+    mean_sq_distance = np.mean(sq_distances)
+    std_sq_distance = np.std(sq_distances)
+
     # 找到在阈值范围内的点
-    mask = distances < (mean_distance + threshold * std_distance)
+    mask = sq_distances < (mean_sq_distance + threshold * std_sq_distance)
     
     # 应用过滤
     filtered_points = points[mask]
@@ -114,12 +119,19 @@ def remove_duplicate_points(points: np.ndarray, colors: np.ndarray, tolerance: f
     Returns:
         Tuple[np.ndarray, np.ndarray]: 去重后的坐标和颜色数组
     """
-    # 使用四舍五入到指定精度来检测重复点
-    rounded_points = np.round(points / tolerance) * tolerance
-    
-    # 找到唯一的点
-    unique_points, indices = np.unique(rounded_points, axis=0, return_index=True)
-    
+    # 将每个点量化到体素网格，并把三维索引无损打包成一维整数键
+    # （对1维整数数组去重比对Nx3浮点数组按行去重快得多；
+    # 每轴21位的位打包是单射，不同体素不会像乘法/异或哈希那样撞成同一键）
+    quantized = np.round(points / tolerance).astype(np.int64)
+    bias = 1 << 20  # 偏移到非负后每轴占21位，三轴合计63位
+
+    if quantized.size and np.abs(quantized).max() >= bias:
+        # 体素索引超出打包范围时退回按行去重，保证不误删真实点
+        _, indices = np.unique(quantized, axis=0, return_index=True)
+    else:
+        keys = ((quantized[:, 0] + bias) << 42) | ((quantized[:, 1] + bias) << 21) | (quantized[:, 2] + bias)
+        _, indices = np.unique(keys, return_index=True)
+
     # 返回去重后的点和对应的颜色
     return points[indices], colors[indices]
 
@@ -139,9 +151,9 @@ def downsample_pointcloud(points: np.ndarray, colors: np.ndarray, target_size: i
     if len(points) <= target_size:
         return points, colors
     
-    # 随机选择点
-    indices = np.random.choice(len(points), target_size, replace=False)
-    
+    # 随机选择点（shuffle=False跳过输出洗牌，且不再分配N长度的置换数组）
+    indices = _rng.choice(len(points), size=target_size, replace=False, shuffle=False)
+
     return points[indices], colors[indices]
 
 
@@ -1,7 +1,8 @@
+import json
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-from typing import Optional, Tuple
+from typing import Optional
 import logging
 import matplotlib
 
@@ -9,106 +10,372 @@ import matplotlib
 matplotlib.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'WenQuanYi Micro Hei', 'Heiti TC', 'SimHei']  # 用来正常显示中文标签
 matplotlib.rcParams['axes.unicode_minus'] = False    # 用来正常显示负号
 
+# vispy为可选的GPU渲染后端：matplotlib的3D散点在CPU上逐点栅格化，
+# 大点云下只能靠降采样保持流畅；vispy把绘制交给OpenGL，可直接渲染完整点云
+try:
+    import vispy.scene
+    from vispy.scene import visuals as vispy_visuals
+    _HAS_VISPY = True
+except ImportError:
+    _HAS_VISPY = False
 
-def visualize_pointcloud(points: np.ndarray, colors: np.ndarray, title: str = "Point Cloud"):
+# pyqtgraph同样为可选后端：GLScatterPlotItem把点云一次性上传到VBO，
+# 旋转/缩放时的MVP变换全部在GPU完成，交互帧率不再受点数限制
+try:
+    from pyqtgraph.Qt import QtWidgets as _pg_qtwidgets
+    import pyqtgraph.opengl as _pg_opengl
+    _HAS_PYQTGRAPH = True
+except ImportError:
+    _HAS_PYQTGRAPH = False
+
+# numba可选：超大点云下包围盒归约和等间隔采样融合成一次并行扫描
+try:
+    from numba import njit as _njit, prange as _prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# 点数超过该阈值时走numba融合内核（单核NumPy归约在此规模开始受内存带宽限制）
+_NUMBA_THRESHOLD = 200_000
+
+if _HAS_NUMBA:
+    @_njit(parallel=True, fastmath=True, cache=True)
+    def _bounds_and_stride_sample(points, stride, out_points, bounds_out):
+        """并行单遍扫描：同时求每轴min/max并写出每stride个点的等间隔采样"""
+        n = points.shape[0]
+        min_x = points[0, 0]
+        min_y = points[0, 1]
+        min_z = points[0, 2]
+        max_x = min_x
+        max_y = min_y
+        max_z = min_z
+        for i in _prange(n):
+            x = points[i, 0]
+            y = points[i, 1]
+            z = points[i, 2]
+            min_x = min(min_x, x)
+            min_y = min(min_y, y)
+            min_z = min(min_z, z)
+            max_x = max(max_x, x)
+            max_y = max(max_y, y)
+            max_z = max(max_z, z)
+            if i % stride == 0 and i // stride < out_points.shape[0]:
+                out_points[i // stride, 0] = x
+                out_points[i // stride, 1] = y
+                out_points[i // stride, 2] = z
+        bounds_out[0, 0] = min_x
+        bounds_out[0, 1] = min_y
+        bounds_out[0, 2] = min_z
+        bounds_out[1, 0] = max_x
+        bounds_out[1, 1] = max_y
+        bounds_out[1, 2] = max_z
+
+# 降采样使用的随机数生成器（新Generator API，选取k个索引无需生成N长度置换）
+_rng = np.random.default_rng()
+
+
+def _sample_indices(num_points: int, max_points: int, sampling: str = 'random') -> np.ndarray:
+    """
+    生成可视化降采样的索引
+
+    Args:
+        num_points: 点云总点数
+        max_points: 目标采样点数
+        sampling: 采样方式，'random'为随机采样，'stride'为等间隔采样
+                  （stride产生单调索引，后续取点对缓存更友好）
+
+    Returns:
+        np.ndarray: 采样索引数组
+    """
+    if sampling == 'stride':
+        return np.arange(0, num_points, num_points // max_points)[:max_points]
+    return _rng.choice(num_points, size=max_points, replace=False, shuffle=False)
+
+
+# 按调用点复用的采样缓冲区，避免每次可视化都为采样结果新分配数组
+_scratch_buffers = {}
+
+# 按标题缓存的(fig, ax, scatter)，重复显示同一标题时原地更新散点数据
+# 而不是重新构建整个Figure（循环/流式调用下每帧节省数百毫秒的初始化）
+_fig_cache = {}
+
+
+def _take_sampled(array: np.ndarray, indices: np.ndarray, tag: str) -> np.ndarray:
+    """
+    将采样行收集到可复用的缓冲区中
+
+    Args:
+        array: 源数组(Nx3)
+        indices: 采样索引
+        tag: 调用点标识（同一标识的连续调用复用同一块缓冲）
+
+    Returns:
+        np.ndarray: 采样后的数组（缓冲区视图，下次同tag调用前有效）
+    """
+    key = (tag, len(indices), array.shape[1], array.dtype)
+    buffer = _scratch_buffers.get(key)
+    if buffer is None:
+        buffer = np.empty((len(indices), array.shape[1]), array.dtype)
+        _scratch_buffers[key] = buffer
+    np.take(array, indices, axis=0, out=buffer)
+    return buffer
+
+
+def _rgba(colors: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    由RGB颜色和统一透明度构建float32的RGBA数组
+
+    提前拼好RGBA传给scatter（配合alpha=None）可以跳过matplotlib
+    内部每次绘制时的RGB->RGBA广播转换。
+    """
+    rgba = np.empty((len(colors), 4), dtype=np.float32)
+    rgba[:, :3] = colors
+    rgba[:, 3] = alpha
+    return rgba
+
+
+def _as_f32c(array: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """
+    转换为C连续的float32数组（None原样返回）
+
+    matplotlib和OpenGL内部都以float32工作，提前降型可将后续
+    归约/采样/上传经过的字节数减半。
+    """
+    if array is None:
+        return None
+    return np.ascontiguousarray(array, dtype=np.float32)
+
+
+def _axis_limits(points: np.ndarray):
+    """计算等比例坐标轴范围（单次min/max归约），返回(mid, half)"""
+    min_vals = points.min(axis=0)
+    max_vals = points.max(axis=0)
+    mid = 0.5 * (min_vals + max_vals)
+    half = 0.5 * float((max_vals - min_vals).max())
+    return mid, half
+
+
+def _render_cloud(ax, points: np.ndarray, colors: np.ndarray, *, max_points: int = 5000,
+                  alpha: float = 0.6, size: int = 10, label: Optional[str] = None,
+                  sampling: str = 'random', tag: str = 'cloud', x_offset: float = 0.0):
+    """
+    降采样并绘制一块点云——matplotlib点云散点的唯一numpy路径
+
+    采样走复用缓冲区，颜色提前拼成RGBA，散点关闭深度排序/逐点抗锯齿；
+    对这条路径的任何性能改动都会同时作用于所有查看器。
+
+    Args:
+        ax: 3D坐标轴
+        points: 坐标数组(Nx3)
+        colors: 颜色数组(Nx3)
+        max_points: 降采样上限
+        alpha: 点的透明度
+        size: 点的大小
+        label: 图例标签
+        sampling: 降采样方式，'random'或'stride'
+        tag: 采样缓冲区标识（同一标识复用缓冲）
+        x_offset: 绘制时施加的X方向平移（不复制数据）
+
+    Returns:
+        tuple: (散点集合, 实际绘制的采样点数组)
+    """
+    if len(points) > max_points:
+        indices = _sample_indices(len(points), max_points, sampling)
+        points = _take_sampled(points, indices, tag + '_points')
+        colors = _take_sampled(colors, indices, tag + '_colors')
+
+    xs = points[:, 0] + x_offset if x_offset else points[:, 0]
+    scatter = ax.scatter(
+        xs, points[:, 1], points[:, 2],
+        c=_rgba(colors, alpha),
+        alpha=None,
+        s=size,
+        depthshade=False,  # 跳过每帧的Python级深度排序/明暗计算
+        rasterized=True,
+        antialiased=False,
+        label=label
+    )
+    return scatter, points
+
+
+def _vispy_show_pointcloud(points: np.ndarray, colors: np.ndarray, title: str,
+                           keypoints: Optional[np.ndarray] = None):
+    """
+    使用vispy（OpenGL）渲染点云，支持鼠标旋转/缩放
+
+    Args:
+        points: 坐标数组(Nx3)
+        colors: 颜色数组(Nx3)
+        title: 窗口标题
+        keypoints: 特征点坐标数组(Mx3)，可选
+    """
+    canvas = vispy.scene.SceneCanvas(title=title, keys='interactive', show=True)
+    view = canvas.central_widget.add_view()
+    view.camera = 'turntable'
+
+    markers = vispy_visuals.Markers()
+    markers.set_data(points, face_color=colors, size=5)
+    view.add(markers)
+
+    if keypoints is not None and len(keypoints) > 0:
+        keypoint_markers = vispy_visuals.Markers()
+        keypoint_markers.set_data(keypoints, face_color='red', size=15)
+        view.add(keypoint_markers)
+
+    view.camera.set_range()
+    print(f"显示点云: {title} (按 '关闭窗口' 继续)")
+    canvas.app.run()
+
+
+def _pyqtgraph_show_pointcloud(points: np.ndarray, colors: np.ndarray,
+                               keypoints: Optional[np.ndarray] = None):
+    """
+    使用pyqtgraph（OpenGL）渲染点云，顶点数据只上传一次到GPU
+
+    Args:
+        points: 坐标数组(Nx3)
+        colors: 颜色数组(Nx3)
+        keypoints: 特征点坐标数组(Mx3)，可选
+    """
+    app = _pg_qtwidgets.QApplication.instance() or _pg_qtwidgets.QApplication([])
+
+    widget = _pg_opengl.GLViewWidget()
+    widget.setWindowTitle('交互式点云查看器')
+
+    scatter = _pg_opengl.GLScatterPlotItem(
+        pos=np.ascontiguousarray(points, dtype=np.float32),
+        color=_rgba(colors, 0.8), size=3, pxMode=True)
+    widget.addItem(scatter)
+
+    if keypoints is not None and len(keypoints) > 0:
+        keypoint_scatter = _pg_opengl.GLScatterPlotItem(
+            pos=np.ascontiguousarray(keypoints, dtype=np.float32),
+            color=(1.0, 0.0, 0.0, 1.0), size=12, pxMode=True)
+        widget.addItem(keypoint_scatter)
+
+    # 根据包围盒设置初始相机距离
+    _, half = _axis_limits(points)
+    widget.setCameraPosition(distance=half * 3)
+
+    widget.show()
+    app.exec_()
+
+
+def visualize_pointcloud(points: np.ndarray, colors: np.ndarray, title: str = "Point Cloud",
+                         use_matplotlib: bool = False, sampling: str = 'random'):
     """
     可视化点云数据
-    
+
     Args:
         points: 坐标数组(Nx3)
         colors: 颜色数组(Nx3)，值范围[0,1]
         title: 窗口标题
+        use_matplotlib: 强制使用matplotlib后端（默认在vispy可用时优先走GPU渲染）
+        sampling: 降采样方式，'random'或'stride'
     """
+    points = _as_f32c(points)
+    colors = _as_f32c(colors)
+
+    # vispy可用时直接渲染完整点云，无需降采样
+    if _HAS_VISPY and not use_matplotlib:
+        _vispy_show_pointcloud(points, colors, title)
+        return
+
+    max_points = 5000
+    if _HAS_NUMBA and len(points) > _NUMBA_THRESHOLD:
+        # 超大点云：一次并行扫描同时得到包围盒和等间隔采样
+        stride = len(points) // max_points
+        sampled_count = min(max_points, (len(points) + stride - 1) // stride)
+        sampled_points = np.empty((sampled_count, 3), dtype=np.float32)
+        bounds = np.empty((2, 3), dtype=np.float32)
+        _bounds_and_stride_sample(points, stride, sampled_points, bounds)
+        mid = 0.5 * (bounds[0] + bounds[1])
+        half = 0.5 * float((bounds[1] - bounds[0]).max())
+        colors = colors[::stride][:sampled_count]  # 等间隔切片是视图，无拷贝
+        points = sampled_points
+    else:
+        # 在降采样前基于完整点云计算包围盒（视野框住全部数据而非采样子集）
+        mid, half = _axis_limits(points)
+
+        # 降采样点云以提高可视化性能（收集到复用缓冲区，避免fancy-index新拷贝）
+        # 缓冲区按标题区分：缓存的Figure通过_offsets3d持有这块缓冲的视图，
+        # 共用同一缓冲会让另一标题的下一帧原地覆盖仍打开窗口的数据
+        if len(points) > max_points:
+            indices = _sample_indices(len(points), max_points, sampling)
+            points = _take_sampled(points, indices, 'viz_points:' + title)
+            colors = _take_sampled(colors, indices, 'viz_colors:' + title)
+
+    # 同标题的窗口仍打开时，原地更新已有散点而不是重建Figure
+    cached = _fig_cache.get(title)
+    if cached is not None and plt.fignum_exists(cached[0].number):
+        fig, ax, scatter = cached
+        scatter._offsets3d = (points[:, 0], points[:, 1], points[:, 2])
+        rgba = _rgba(colors, 0.8)
+        scatter.set_facecolors(rgba)
+        scatter.set_edgecolors(rgba)
+        ax.set_xlim([mid[0] - half, mid[0] + half])
+        ax.set_ylim([mid[1] - half, mid[1] + half])
+        ax.set_zlim([mid[2] - half, mid[2] + half])
+        fig.canvas.draw_idle()
+        return
+
     # 创建3D图形
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection='3d')
-    
-    # 降采样点云以提高可视化性能
-    max_points = 5000
-    if len(points) > max_points:
-        indices = np.random.choice(len(points), max_points, replace=False)
-        points = points[indices]
-        colors = colors[indices]
-    
-    # 绘制点云
-    scatter = ax.scatter(
-        points[:, 0], points[:, 1], points[:, 2],
-        c=colors,
-        s=10,  # 点的大小
-        alpha=0.8  # 透明度
-    )
-    
+
+    # 绘制点云（数据在上方已完成降采样）
+    scatter, _ = _render_cloud(ax, points, colors, alpha=0.8, tag='viz')
+
     # 设置坐标轴
     ax.set_xlabel('X')
     ax.set_ylabel('Y')
     ax.set_zlabel('Z')
     ax.set_title(title)
-    
+
     # 设置坐标轴范围相等
-    max_range = np.max([np.max(points[:, 0]) - np.min(points[:, 0]),
-                        np.max(points[:, 1]) - np.min(points[:, 1]),
-                        np.max(points[:, 2]) - np.min(points[:, 2])])
-    mid_x = (np.max(points[:, 0]) + np.min(points[:, 0])) / 2
-    mid_y = (np.max(points[:, 1]) + np.min(points[:, 1])) / 2
-    mid_z = (np.max(points[:, 2]) + np.min(points[:, 2])) / 2
-    
-    ax.set_xlim([mid_x - max_range/2, mid_x + max_range/2])
-    ax.set_ylim([mid_y - max_range/2, mid_y + max_range/2])
-    ax.set_zlim([mid_z - max_range/2, mid_z + max_range/2])
-    
+    ax.set_xlim([mid[0] - half, mid[0] + half])
+    ax.set_ylim([mid[1] - half, mid[1] + half])
+    ax.set_zlim([mid[2] - half, mid[2] + half])
+
+    _fig_cache[title] = (fig, ax, scatter)
+
     plt.tight_layout()
     print(f"显示点云: {title} (按 '关闭窗口' 继续)")
     plt.show()
 
 
-def highlight_keypoints(points: np.ndarray, keypoints: np.ndarray, colors: np.ndarray, 
-                       keypoint_color: Tuple[float, float, float] = (1, 0, 0)):
-    """
-    高亮显示特征点
-    
-    Args:
-        points: 原始点云坐标数组(Nx3)
-        keypoints: 特征点坐标数组(Mx3)
-        colors: 原始点云颜色数组(Nx3)
-        keypoint_color: 特征点高亮颜色
-    
-    Returns:
-        Tuple[np.ndarray, np.ndarray, np.ndarray]: 原始点云坐标、原始点云颜色、特征点坐标
-    """
-    return points, colors, keypoints
-
-
-def create_interactive_viewer(points: np.ndarray, colors: np.ndarray, keypoints: Optional[np.ndarray] = None):
+def create_interactive_viewer(points: np.ndarray, colors: np.ndarray, keypoints: Optional[np.ndarray] = None,
+                              use_matplotlib: bool = False, sampling: str = 'random'):
     """
     创建交互式查看器
-    
+
     Args:
         points: 坐标数组(Nx3)
         colors: 颜色数组(Nx3)
         keypoints: 特征点坐标数组(Mx3)，可选
+        use_matplotlib: 强制使用matplotlib后端（默认在vispy可用时优先走GPU渲染）
+        sampling: 降采样方式，'random'或'stride'
     """
+    points = _as_f32c(points)
+    colors = _as_f32c(colors)
+    keypoints = _as_f32c(keypoints)
+
+    # GPU后端可用时直接渲染完整点云，无需降采样
+    # （pyqtgraph的GLViewWidget交互体验最好，其次vispy，最后回退matplotlib）
+    if _HAS_PYQTGRAPH and not use_matplotlib:
+        _pyqtgraph_show_pointcloud(points, colors, keypoints)
+        return
+    if _HAS_VISPY and not use_matplotlib:
+        _vispy_show_pointcloud(points, colors, '交互式点云查看器', keypoints)
+        return
+
     # 创建3D图形
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection='3d')
     
-    # 降采样点云以提高可视化性能
-    max_points = 5000
-    if len(points) > max_points:
-        indices = np.random.choice(len(points), max_points, replace=False)
-        sampled_points = points[indices]
-        sampled_colors = colors[indices]
-    else:
-        sampled_points = points
-        sampled_colors = colors
-    
-    # 绘制原始点云
-    ax.scatter(
-        sampled_points[:, 0], sampled_points[:, 1], sampled_points[:, 2],
-        c=sampled_colors,
-        s=10,
-        alpha=0.6,
-        label='原始点云'
-    )
+    # 降采样并绘制原始点云
+    _render_cloud(ax, points, colors, alpha=0.6, label='原始点云',
+                  sampling=sampling, tag='viewer')
     
     # 绘制特征点（如果有）
     if keypoints is not None and len(keypoints) > 0:
@@ -131,18 +398,12 @@ def create_interactive_viewer(points: np.ndarray, colors: np.ndarray, keypoints:
     # 添加图例
     ax.legend()
     
-    # 设置坐标轴范围相等
-    max_range = np.max([np.max(points[:, 0]) - np.min(points[:, 0]),
-                        np.max(points[:, 1]) - np.min(points[:, 1]),
-                        np.max(points[:, 2]) - np.min(points[:, 2])])
-    mid_x = (np.max(points[:, 0]) + np.min(points[:, 0])) / 2
-    mid_y = (np.max(points[:, 1]) + np.min(points[:, 1])) / 2
-    mid_z = (np.max(points[:, 2]) + np.min(points[:, 2])) / 2
-    
-    ax.set_xlim([mid_x - max_range/2, mid_x + max_range/2])
-    ax.set_ylim([mid_y - max_range/2, mid_y + max_range/2])
-    ax.set_zlim([mid_z - max_range/2, mid_z + max_range/2])
-    
+    # 设置坐标轴范围相等（基于完整点云的包围盒）
+    mid, half = _axis_limits(points)
+    ax.set_xlim([mid[0] - half, mid[0] + half])
+    ax.set_ylim([mid[1] - half, mid[1] + half])
+    ax.set_zlim([mid[2] - half, mid[2] + half])
+
     # 显示帮助信息
     help_text = """
     交互式点云查看器控制:
@@ -158,10 +419,11 @@ def create_interactive_viewer(points: np.ndarray, colors: np.ndarray, keypoints:
 
 
 def visualize_comparison(points_left: np.ndarray, colors_left: np.ndarray, features_left: np.ndarray,
-                         points_right: np.ndarray, colors_right: np.ndarray, features_right: np.ndarray):
+                         points_right: np.ndarray, colors_right: np.ndarray, features_right: np.ndarray,
+                         sampling: str = 'random'):
     """
     比较左右摄像头的点云和特征点
-    
+
     Args:
         points_left: 左摄像头点云坐标
         colors_left: 左摄像头点云颜色
@@ -169,50 +431,30 @@ def visualize_comparison(points_left: np.ndarray, colors_left: np.ndarray, featu
         points_right: 右摄像头点云坐标
         colors_right: 右摄像头点云颜色
         features_right: 右摄像头特征点
+        sampling: 降采样方式，'random'或'stride'
     """
-    # 为了在同一视图中显示，将右侧点云平移
-    points_right_shifted = points_right.copy()
-    points_right_shifted[:, 0] += np.max(points_left[:, 0]) - np.min(points_right[:, 0]) + 1.0
-    
+    points_left = _as_f32c(points_left)
+    colors_left = _as_f32c(colors_left)
+    features_left = _as_f32c(features_left)
+    points_right = _as_f32c(points_right)
+    colors_right = _as_f32c(colors_right)
+    features_right = _as_f32c(features_right)
+
+    # 为了在同一视图中显示，右侧点云在绘制时整体沿X轴平移
+    # （只计算一次偏移量，不再复制整块右侧点云）
+    x_offset = float(points_left[:, 0].max() - points_right[:, 0].min() + 1.0)
+
     # 创建3D图形
     fig = plt.figure(figsize=(12, 10))
     ax = fig.add_subplot(111, projection='3d')
-    
-    # 降采样点云以提高可视化性能
-    max_points = 3000
-    if len(points_left) > max_points:
-        left_indices = np.random.choice(len(points_left), max_points, replace=False)
-        sampled_left_points = points_left[left_indices]
-        sampled_left_colors = colors_left[left_indices]
-    else:
-        sampled_left_points = points_left
-        sampled_left_colors = colors_left
-    
-    if len(points_right_shifted) > max_points:
-        right_indices = np.random.choice(len(points_right_shifted), max_points, replace=False)
-        sampled_right_points = points_right_shifted[right_indices]
-        sampled_right_colors = colors_right[right_indices]
-    else:
-        sampled_right_points = points_right_shifted
-        sampled_right_colors = colors_right
-    
-    # 绘制左侧点云
-    ax.scatter(
-        sampled_left_points[:, 0], sampled_left_points[:, 1], sampled_left_points[:, 2],
-        c=sampled_left_colors,
-        s=10,
-        alpha=0.6,
-        label='左摄像头点云'
-    )
-    
-    # 绘制右侧点云
-    ax.scatter(
-        sampled_right_points[:, 0], sampled_right_points[:, 1], sampled_right_points[:, 2],
-        c=sampled_right_colors,
-        s=10,
-        alpha=0.6,
-        label='右摄像头点云'
-    )
+
+    # 降采样并绘制左右点云（右侧X坐标在绘制时加偏移）
+    _, sampled_left_points = _render_cloud(
+        ax, points_left, colors_left, max_points=3000,
+        label='左摄像头点云', sampling=sampling, tag='cmp_left')
+    _, sampled_right_points = _render_cloud(
+        ax, points_right, colors_right, max_points=3000,
+        label='右摄像头点云', sampling=sampling, tag='cmp_right', x_offset=x_offset)
     
     # 绘制特征点
     if len(features_left) > 0:
@@ -227,12 +469,9 @@ def visualize_comparison(points_left: np.ndarray, colors_left: np.ndarray, featu
         )
     
     if len(features_right) > 0:
-        # 平移右侧特征点以匹配点云
-        features_right_shifted = features_right.copy()
-        features_right_shifted[:, 0] += np.max(points_left[:, 0]) - np.min(points_right[:, 0]) + 1.0
-        
+        # 右侧特征点同样在绘制时平移以匹配点云
         ax.scatter(
-            features_right_shifted[:, 0], features_right_shifted[:, 1], features_right_shifted[:, 2],
+            features_right[:, 0] + x_offset, features_right[:, 1], features_right[:, 2],
             c='green',
             s=50,
             marker='o',
@@ -246,31 +485,127 @@ def visualize_comparison(points_left: np.ndarray, colors_left: np.ndarray, featu
     ax.set_ylabel('Y')
     ax.set_zlabel('Z')
     ax.set_title('双目点云对比')
-    
+
     # 添加图例
     ax.legend()
-    
+
+    # 设置坐标轴范围相等（合并左右包围盒，右侧按绘制偏移修正，无需拼接数组）
+    offset_vec = np.array([x_offset, 0.0, 0.0], dtype=np.float32)
+    min_vals = np.minimum(sampled_left_points.min(axis=0),
+                          sampled_right_points.min(axis=0) + offset_vec)
+    max_vals = np.maximum(sampled_left_points.max(axis=0),
+                          sampled_right_points.max(axis=0) + offset_vec)
+    mid = 0.5 * (min_vals + max_vals)
+    half = 0.5 * float((max_vals - min_vals).max())
+    ax.set_xlim([mid[0] - half, mid[0] + half])
+    ax.set_ylim([mid[1] - half, mid[1] + half])
+    ax.set_zlim([mid[2] - half, mid[2] + half])
+
     plt.tight_layout()
     plt.show()
 
 
-# HTML导出功能暂时禁用（依赖open3d和JavaScript相关功能）
-# def export_visualization_html(points: np.ndarray, colors: np.ndarray, keypoints: np.ndarray, 
-#                              filepath: str = "visualization.html"):
-#     """
-#     导出可视化结果为HTML文件（简单实现）
-#     
-#     Args:
-#         points: 点云坐标
-#         colors: 点云颜色
-#         keypoints: 特征点
-#         filepath: 输出HTML文件路径
-#     """
-#     try:
-#         # 创建HTML内容并保存
-#         print("HTML导出功能已暂时禁用")
-#     except Exception as e:
-#         print(f"导出HTML失败: {str(e)}")
+# 内嵌three.js点云查看器模板：数据序列化为JSON后交给浏览器端WebGL渲染，
+# 渲染负载完全落在客户端GPU上，远程服务器无需X转发也能交互查看
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+<meta charset="utf-8">
+<title>点云可视化</title>
+<style>body { margin: 0; overflow: hidden; }</style>
+<script src="https://cdn.jsdelivr.net/npm/three@0.128.0/build/three.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/three@0.128.0/examples/js/controls/OrbitControls.js"></script>
+</head>
+<body>
+<script>
+const data = __POINTCLOUD_DATA__;
+
+const scene = new THREE.Scene();
+scene.background = new THREE.Color(0x111111);
+const camera = new THREE.PerspectiveCamera(60, window.innerWidth / window.innerHeight, 0.001, 1000);
+const renderer = new THREE.WebGLRenderer({antialias: true});
+renderer.setSize(window.innerWidth, window.innerHeight);
+document.body.appendChild(renderer.domElement);
+
+function makePoints(positions, colors, size) {
+    const geometry = new THREE.BufferGeometry();
+    geometry.setAttribute('position', new THREE.Float32BufferAttribute(positions, 3));
+    const material = new THREE.PointsMaterial({size: size, sizeAttenuation: true});
+    if (colors) {
+        geometry.setAttribute('color', new THREE.Float32BufferAttribute(colors, 3));
+        material.vertexColors = true;
+    } else {
+        material.color.set(0xff0000);
+    }
+    return new THREE.Points(geometry, material);
+}
+
+const cloud = makePoints(data.points, data.colors, 0.01);
+scene.add(cloud);
+if (data.keypoints.length > 0) {
+    scene.add(makePoints(data.keypoints, null, 0.03));
+}
+
+cloud.geometry.computeBoundingSphere();
+const sphere = cloud.geometry.boundingSphere;
+camera.position.copy(sphere.center);
+camera.position.z += sphere.radius * 2.5;
+const controls = new THREE.OrbitControls(camera, renderer.domElement);
+controls.target.copy(sphere.center);
+
+function animate() {
+    requestAnimationFrame(animate);
+    controls.update();
+    renderer.render(scene, camera);
+}
+animate();
+
+window.addEventListener('resize', () => {
+    camera.aspect = window.innerWidth / window.innerHeight;
+    camera.updateProjectionMatrix();
+    renderer.setSize(window.innerWidth, window.innerHeight);
+});
+</script>
+</body>
+</html>
+"""
+
+
+def export_visualization_html(points: np.ndarray, colors: np.ndarray, keypoints: Optional[np.ndarray] = None,
+                              filepath: str = "visualization.html"):
+    """
+    导出可视化结果为HTML文件（内嵌three.js WebGL查看器）
+
+    Args:
+        points: 点云坐标(Nx3)
+        colors: 点云颜色(Nx3)，值范围[0,1]
+        keypoints: 特征点坐标(Mx3)，可选（以红色大点显示）
+        filepath: 输出HTML文件路径
+
+    Raises:
+        IOError: 文件写入错误
+    """
+    points = _as_f32c(points)
+    colors = _as_f32c(colors)
+    keypoints = _as_f32c(keypoints)
+
+    # 坐标/颜色保留4位小数以控制文件体积
+    data = {
+        'points': np.round(points, 4).ravel().tolist(),
+        'colors': np.round(colors, 4).ravel().tolist(),
+        'keypoints': (np.round(keypoints, 4).ravel().tolist()
+                      if keypoints is not None and len(keypoints) > 0 else []),
+    }
+
+    html = _HTML_TEMPLATE.replace('__POINTCLOUD_DATA__',
+                                  json.dumps(data, separators=(',', ':')))
+
+    try:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"可视化HTML已导出: {filepath} (在浏览器中打开即可交互查看)")
+    except Exception as e:
+        raise IOError(f"导出HTML失败: {str(e)}")
 
 
 if __name__ == "__main__":